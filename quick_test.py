@@ -4,25 +4,12 @@ Quick test script for Transistor Database - Simple and fast verification.
 This is a minimal test to quickly verify the installation works.
 """
 
-import os
 import sys
+import traceback
 from pathlib import Path
 
-# Check Python version
-if sys.version_info < (3, 11):
-    print("=" * 60)
-    print("Python Version Warning")
-    print("=" * 60)
-    print(f"\nCurrent Python version: {sys.version}")
-    print("This project requires Python 3.11 or higher.")
-    print("\nThe project uses Python 3.11+ features (union types: int | float).")
-    print("\nPlease upgrade Python or use a virtual environment with Python 3.11+")
-    print("\nYou can download Python 3.11+ from: https://www.python.org/downloads/")
-    sys.exit(1)
-
-# Add project root to path
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
+_HERE = Path(__file__).resolve().parent
+_DEFAULT_DB = _HERE / "transistordatabase" / "examples" / "tdb_example"
 
 try:
     from transistordatabase.database_manager import DatabaseManager
@@ -33,10 +20,7 @@ try:
     
     # Initialize database
     print("\n1. Initializing database...")
-    db_path = os.path.join(
-        os.path.dirname(os.path.abspath(__file__)),
-        "transistordatabase", "examples", "tdb_example"
-    )
+    db_path = str(_DEFAULT_DB)
     
     tdb = DatabaseManager()
     tdb.set_operation_mode_json(db_path)
@@ -52,19 +36,20 @@ try:
         sys.exit(0)
     
     print(f"   [OK] Found {len(transistor_names)} transistor(s):")
-    for name in transistor_names[:5]:  # Show first 5
-        print(f"      - {name}")
+    print("\n".join(f"      - {name}" for name in transistor_names[:5]))  # Show first 5
     if len(transistor_names) > 5:
         print(f"      ... and {len(transistor_names) - 5} more")
     
     # Load first transistor
     print(f"\n3. Loading transistor: {transistor_names[0]}...")
     transistor = tdb.load_transistor(transistor_names[0])
-    print(f"   [OK] Loaded: {transistor.name}")
-    print(f"      Manufacturer: {transistor.manufacturer}")
-    print(f"      Type: {transistor.type}")
-    print(f"      Max Voltage: {transistor.v_abs_max} V")
-    print(f"      Max Current: {transistor.i_abs_max} A")
+    print("\n".join([
+        f"   [OK] Loaded: {transistor.name}",
+        f"      Manufacturer: {transistor.manufacturer}",
+        f"      Type: {transistor.type}",
+        f"      Max Voltage: {transistor.v_abs_max} V",
+        f"      Max Current: {transistor.i_abs_max} A",
+    ]))
     
     # Test working point
     print("\n4. Testing working point calculation...")
@@ -85,13 +70,12 @@ try:
     
 except ImportError as e:
     print(f"\n[ERROR] Import error: {e}")
-    print("   Make sure you've installed all dependencies:")
-    print("   pip install -r requirements.txt")
+    print("   Make sure you've installed the package and all dependencies:")
+    print("   pip install -e .")
     sys.exit(1)
     
 except Exception as e:
     print(f"\n[ERROR] Error: {e}")
-    import traceback
     traceback.print_exc()
     sys.exit(1)
 
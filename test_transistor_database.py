@@ -5,28 +5,58 @@ This script demonstrates and tests the main functionality of the transistordatab
 Run this script to verify the installation and functionality.
 """
 
+import concurrent.futures
 import os
 import sys
+import traceback
 from pathlib import Path
 
+# Use the non-interactive matplotlib backend, it must be selected before transistordatabase imports pyplot
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+# Project paths, resolved once
+_HERE = Path(__file__).resolve().parent
+_DEFAULT_DB = _HERE / "transistordatabase" / "examples" / "tdb_example"
+_OUTPUT_DIR = _HERE / "test_outputs"
+
 # Add the project root to the path
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(_HERE))
 
 from transistordatabase.database_manager import DatabaseManager
 from transistordatabase.exceptions import MissingDataError
 
 # Configuration
-ENABLE_PLOTTING = False  # Set to True to enable matplotlib plots (requires display)
+ENABLE_PLOTTING = False  # Set to True to enable matplotlib plots (rendered with the Agg backend)
 ENABLE_EXPORTS = True    # Set to True to test export functions
 TEST_DATABASE_PATH = None  # Will use examples/tdb_example if None
 
 
+class Reporter:
+    """Collect the output lines of a test section and write them to stdout at once."""
+
+    def __init__(self):
+        self.buf: list[str] = []
+
+    def line(self, text: str = "") -> None:
+        """Add a line to the output buffer."""
+        self.buf.append(text)
+
+    def flush(self) -> None:
+        """Write all buffered lines to stdout with a single write call."""
+        if self.buf:
+            sys.stdout.write("\n".join(self.buf) + "\n")
+            sys.stdout.flush()
+            self.buf.clear()
+
+
+rep = Reporter()
+
+
 def print_section(title):
     """Print a formatted section header."""
-    print("\n" + "=" * 70)
-    print(f"  {title}")
-    print("=" * 70)
+    rep.line("\n" + "=" * 70)
+    rep.line(f"  {title}")
+    rep.line("=" * 70)
 
 
 def test_database_initialization():
@@ -36,31 +66,28 @@ def test_database_initialization():
     try:
         # Determine database path
         if TEST_DATABASE_PATH is None:
-            db_path = os.path.join(
-                os.path.dirname(os.path.abspath(__file__)),
-                "transistordatabase", "examples", "tdb_example"
-            )
+            db_path = str(_DEFAULT_DB)
         else:
             db_path = TEST_DATABASE_PATH
         
         # Check if database exists
         if not os.path.exists(db_path):
-            print(f"⚠️  Database path not found: {db_path}")
-            print("   Creating empty database directory...")
+            rep.line(f"⚠️  Database path not found: {db_path}")
+            rep.line("   Creating empty database directory...")
             os.makedirs(db_path, exist_ok=True)
         
         # Initialize database manager
         tdb = DatabaseManager()
         tdb.set_operation_mode_json(db_path)
         
-        print(f"✅ Database initialized successfully")
-        print(f"   Database path: {db_path}")
-        print(f"   Operation mode: {tdb.operation_mode.value}")
+        rep.line(f"✅ Database initialized successfully")
+        rep.line(f"   Database path: {db_path}")
+        rep.line(f"   Operation mode: {tdb.operation_mode.value}")
         
         return tdb, db_path
     
     except Exception as e:
-        print(f"❌ Database initialization failed: {e}")
+        rep.line(f"❌ Database initialization failed: {e}")
         raise
 
 
@@ -72,18 +99,17 @@ def test_list_transistors(tdb):
         transistor_names = tdb.get_transistor_names_list()
         
         if not transistor_names:
-            print("⚠️  No transistors found in database")
-            print("   You may need to download transistors or add them manually")
+            rep.line("⚠️  No transistors found in database")
+            rep.line("   You may need to download transistors or add them manually")
             return None
         
-        print(f"✅ Found {len(transistor_names)} transistor(s) in database:")
-        for i, name in enumerate(transistor_names, 1):
-            print(f"   {i}. {name}")
+        rep.line(f"✅ Found {len(transistor_names)} transistor(s) in database:")
+        rep.line("\n".join(f"   {i}. {name}" for i, name in enumerate(transistor_names, 1)))
         
         return transistor_names[0] if transistor_names else None
     
     except Exception as e:
-        print(f"❌ Failed to list transistors: {e}")
+        rep.line(f"❌ Failed to list transistors: {e}")
         raise
 
 
@@ -92,28 +118,28 @@ def test_load_transistor(tdb, transistor_name):
     print_section("Test 3: Load Transistor")
     
     if transistor_name is None:
-        print("⚠️  Skipping - No transistor available to load")
+        rep.line("⚠️  Skipping - No transistor available to load")
         return None
     
     try:
         transistor = tdb.load_transistor(transistor_name)
         
-        print(f"✅ Successfully loaded transistor: {transistor.name}")
-        print(f"   Manufacturer: {transistor.manufacturer}")
-        print(f"   Type: {transistor.type}")
-        print(f"   Max Voltage: {transistor.v_abs_max} V")
-        print(f"   Max Current: {transistor.i_abs_max} A")
-        print(f"   Switch Tj max: {transistor.switch.t_j_max} °C")
-        print(f"   Diode Tj max: {transistor.diode.t_j_max} °C")
-        print(f"   Channel datasets (switch): {len(transistor.switch.channel)}")
-        print(f"   Channel datasets (diode): {len(transistor.diode.channel)}")
-        print(f"   E_on datasets: {len(transistor.switch.e_on)}")
-        print(f"   E_off datasets: {len(transistor.switch.e_off)}")
+        rep.line(f"✅ Successfully loaded transistor: {transistor.name}")
+        rep.line(f"   Manufacturer: {transistor.manufacturer}")
+        rep.line(f"   Type: {transistor.type}")
+        rep.line(f"   Max Voltage: {transistor.v_abs_max} V")
+        rep.line(f"   Max Current: {transistor.i_abs_max} A")
+        rep.line(f"   Switch Tj max: {transistor.switch.t_j_max} °C")
+        rep.line(f"   Diode Tj max: {transistor.diode.t_j_max} °C")
+        rep.line(f"   Channel datasets (switch): {len(transistor.switch.channel)}")
+        rep.line(f"   Channel datasets (diode): {len(transistor.diode.channel)}")
+        rep.line(f"   E_on datasets: {len(transistor.switch.e_on)}")
+        rep.line(f"   E_off datasets: {len(transistor.switch.e_off)}")
         
         return transistor
     
     except Exception as e:
-        print(f"❌ Failed to load transistor: {e}")
+        rep.line(f"❌ Failed to load transistor: {e}")
         raise
 
 
@@ -122,39 +148,39 @@ def test_working_point(tdb, transistor):
     print_section("Test 4: Working Point Calculations")
     
     if transistor is None:
-        print("⚠️  Skipping - No transistor loaded")
+        rep.line("⚠️  Skipping - No transistor loaded")
         return
     
     try:
         # Test quickstart working point
-        print("   Testing quickstart_wp()...")
+        rep.line("   Testing quickstart_wp()...")
         transistor.quickstart_wp()
-        print(f"   ✅ Quickstart working point set")
-        print(f"      Switch V_channel: {transistor.wp.switch_v_channel} V")
-        print(f"      Switch R_channel: {transistor.wp.switch_r_channel} Ohm")
+        rep.line(f"   ✅ Quickstart working point set")
+        rep.line(f"      Switch V_channel: {transistor.wp.switch_v_channel} V")
+        rep.line(f"      Switch R_channel: {transistor.wp.switch_r_channel} Ohm")
         
         # Test manual working point update
-        print("\n   Testing update_wp()...")
+        rep.line("\n   Testing update_wp()...")
         transistor.update_wp(t_j=125, v_g=15, i_channel=50)
-        print(f"   ✅ Manual working point set")
-        print(f"      Temperature: 125°C, Gate voltage: 15V, Current: 50A")
+        rep.line(f"   ✅ Manual working point set")
+        rep.line(f"      Temperature: 125°C, Gate voltage: 15V, Current: 50A")
         
         # Test find_approx_wp for switch
-        print("\n   Testing find_approx_wp() for switch...")
+        rep.line("\n   Testing find_approx_wp() for switch...")
         channel, e_on, e_off = transistor.switch.find_approx_wp(
             t_j=125,
             v_g=15,
             normalize_t_to_v=10
         )
-        print(f"   ✅ Found approximate working point")
-        print(f"      Channel Tj: {channel.t_j}°C, Vg: {channel.v_g}V")
-        print(f"      E_on Tj: {e_on.t_j}°C, Vg: {e_on.v_g}V")
-        print(f"      E_off Tj: {e_off.t_j}°C, Vg: {e_off.v_g}V")
+        rep.line(f"   ✅ Found approximate working point")
+        rep.line(f"      Channel Tj: {channel.t_j}°C, Vg: {channel.v_g}V")
+        rep.line(f"      E_on Tj: {e_on.t_j}°C, Vg: {e_on.v_g}V")
+        rep.line(f"      E_off Tj: {e_off.t_j}°C, Vg: {e_off.v_g}V")
         
     except MissingDataError as e:
-        print(f"   ⚠️  Missing data error (expected for some transistors): {e}")
+        rep.line(f"   ⚠️  Missing data error (expected for some transistors): {e}")
     except Exception as e:
-        print(f"   ❌ Working point calculation failed: {e}")
+        rep.line(f"   ❌ Working point calculation failed: {e}")
 
 
 def test_data_access(tdb, transistor):
@@ -162,38 +188,38 @@ def test_data_access(tdb, transistor):
     print_section("Test 5: Data Access")
     
     if transistor is None:
-        print("⚠️  Skipping - No transistor loaded")
+        rep.line("⚠️  Skipping - No transistor loaded")
         return
     
     try:
         # Access switch data
-        print("   Switch data:")
+        rep.line("   Switch data:")
         if transistor.switch.channel:
             ch = transistor.switch.channel[0]
-            print(f"      First channel dataset: Tj={ch.t_j}°C, Vg={ch.v_g}V")
-            print(f"      Data points: {len(ch.graph_v_i[0])}")
+            rep.line(f"      First channel dataset: Tj={ch.t_j}°C, Vg={ch.v_g}V")
+            rep.line(f"      Data points: {len(ch.graph_v_i[0])}")
         
         # Access diode data
-        print("\n   Diode data:")
+        rep.line("\n   Diode data:")
         if transistor.diode.channel:
             ch = transistor.diode.channel[0]
-            print(f"      First channel dataset: Tj={ch.t_j}°C, Vg={ch.v_g}V")
-            print(f"      Data points: {len(ch.graph_v_i[0])}")
+            rep.line(f"      First channel dataset: Tj={ch.t_j}°C, Vg={ch.v_g}V")
+            rep.line(f"      Data points: {len(ch.graph_v_i[0])}")
         
         # Access energy data
-        print("\n   Energy data:")
+        rep.line("\n   Energy data:")
         if transistor.switch.e_on:
             e_on = transistor.switch.e_on[0]
-            print(f"      E_on dataset: Tj={e_on.t_j}°C, Vg={e_on.v_g}V, Vsupply={e_on.v_supply}V")
+            rep.line(f"      E_on dataset: Tj={e_on.t_j}°C, Vg={e_on.v_g}V, Vsupply={e_on.v_supply}V")
         
         if transistor.switch.e_off:
             e_off = transistor.switch.e_off[0]
-            print(f"      E_off dataset: Tj={e_off.t_j}°C, Vg={e_off.v_g}V, Vsupply={e_off.v_supply}V")
+            rep.line(f"      E_off dataset: Tj={e_off.t_j}°C, Vg={e_off.v_g}V, Vsupply={e_off.v_supply}V")
         
-        print("\n   ✅ Data access successful")
+        rep.line("\n   ✅ Data access successful")
         
     except Exception as e:
-        print(f"   ❌ Data access failed: {e}")
+        rep.line(f"   ❌ Data access failed: {e}")
 
 
 def test_plotting(tdb, transistor):
@@ -201,45 +227,39 @@ def test_plotting(tdb, transistor):
     print_section("Test 6: Plotting Functions")
     
     if not ENABLE_PLOTTING:
-        print("   ⚠️  Plotting disabled (set ENABLE_PLOTTING=True to enable)")
+        rep.line("   ⚠️  Plotting disabled (set ENABLE_PLOTTING=True to enable)")
         return
     
     if transistor is None:
-        print("⚠️  Skipping - No transistor loaded")
+        rep.line("⚠️  Skipping - No transistor loaded")
         return
     
     try:
-        import matplotlib
-        matplotlib.use('Agg')  # Use non-interactive backend
-        import matplotlib.pyplot as plt
-        
-        print("   Testing plot functions (plots will be saved, not displayed)...")
+        rep.line("   Testing plot functions (plots will be saved, not displayed)...")
         
         # Test switch plotting
         if transistor.switch.channel:
-            print("   - Testing switch.plot_all_channel_data()...")
+            rep.line("   - Testing switch.plot_all_channel_data()...")
             transistor.switch.plot_all_channel_data(buffer_req=True)
-            print("      ✅ Switch channel data plotted")
+            rep.line("      ✅ Switch channel data plotted")
         
         # Test diode plotting
         if transistor.diode.channel:
-            print("   - Testing diode.plot_all_channel_data()...")
+            rep.line("   - Testing diode.plot_all_channel_data()...")
             transistor.diode.plot_all_channel_data(buffer_req=True)
-            print("      ✅ Diode channel data plotted")
+            rep.line("      ✅ Diode channel data plotted")
         
         # Test energy plotting
         if transistor.switch.e_on and transistor.switch.e_off:
-            print("   - Testing switch.plot_energy_data()...")
+            rep.line("   - Testing switch.plot_energy_data()...")
             result = transistor.switch.plot_energy_data(buffer_req=True)
             if result is not None:
-                print("      ✅ Energy data plotted")
+                rep.line("      ✅ Energy data plotted")
         
-        print("\n   ✅ Plotting tests completed")
+        rep.line("\n   ✅ Plotting tests completed")
         
-    except ImportError:
-        print("   ⚠️  Matplotlib not available for plotting")
     except Exception as e:
-        print(f"   ❌ Plotting failed: {e}")
+        rep.line(f"   ❌ Plotting failed: {e}")
 
 
 def test_export_functions(tdb, transistor):
@@ -247,63 +267,50 @@ def test_export_functions(tdb, transistor):
     print_section("Test 7: Export Functions")
     
     if not ENABLE_EXPORTS:
-        print("   ⚠️  Export tests disabled (set ENABLE_EXPORTS=True to enable)")
+        rep.line("   ⚠️  Export tests disabled (set ENABLE_EXPORTS=True to enable)")
         return
     
     if transistor is None:
-        print("⚠️  Skipping - No transistor loaded")
+        rep.line("⚠️  Skipping - No transistor loaded")
         return
     
     # Create output directory
-    output_dir = os.path.join(os.path.dirname(__file__), "test_outputs")
+    output_dir = str(_OUTPUT_DIR)
     os.makedirs(output_dir, exist_ok=True)
-    original_dir = os.getcwd()
-    
+
+    def export_datasheet():
+        html_str = transistor.export_datasheet(build_collection=True)
+        if html_str:
+            output_file = os.path.join(output_dir, f"{transistor.name}_datasheet.html")
+            with open(output_file, "w", encoding="utf-8") as f:
+                f.write(html_str)
+            return f"Virtual datasheet exported: {output_file}"
+        return "Virtual datasheet export completed"
+
+    # The exports are independent of each other and write to output_dir directly, so they can run concurrently
+    exports = [
+        ("Datasheet", "export_datasheet()", export_datasheet),
+        ("PLECS", "export_plecs()", lambda: transistor.export_plecs(filepath=output_dir)),
+        ("Matlab", "export_matlab()", lambda: transistor.export_matlab(filepath=output_dir)),
+        ("Simulink", "export_simulink_loss_model()", lambda: transistor.export_simulink_loss_model(filepath=output_dir)),
+    ]
+
     try:
-        os.chdir(output_dir)
-        
-        # Test virtual datasheet export
-        print("   Testing export_datasheet()...")
-        try:
-            html_str = transistor.export_datasheet(build_collection=True)
-            if html_str:
-                output_file = os.path.join(output_dir, f"{transistor.name}_datasheet.html")
-                with open(output_file, "w", encoding="utf-8") as f:
-                    f.write(html_str)
-                print(f"      ✅ Virtual datasheet exported: {output_file}")
-        except Exception as e:
-            print(f"      ⚠️  Datasheet export failed: {e}")
-        
-        # Test PLECS export
-        print("\n   Testing export_plecs()...")
-        try:
-            transistor.export_plecs()
-            print("      ✅ PLECS export completed")
-        except Exception as e:
-            print(f"      ⚠️  PLECS export failed: {e}")
-        
-        # Test Matlab export
-        print("\n   Testing export_matlab()...")
-        try:
-            transistor.export_matlab()
-            print("      ✅ Matlab export completed")
-        except Exception as e:
-            print(f"      ⚠️  Matlab export failed: {e}")
-        
-        # Test Simulink export
-        print("\n   Testing export_simulink_loss_model()...")
-        try:
-            transistor.export_simulink_loss_model()
-            print("      ✅ Simulink export completed")
-        except Exception as e:
-            print(f"      ⚠️  Simulink export failed: {e}")
-        
-        print(f"\n   ✅ Export tests completed. Files saved to: {output_dir}")
-        
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(exports)) as executor:
+            futures = [(name, function_name, executor.submit(export)) for name, function_name, export in exports]
+
+        for name, function_name, future in futures:
+            rep.line(f"   Testing {function_name}...")
+            try:
+                message = future.result()
+                rep.line(f"      ✅ {message or f'{name} export completed'}")
+            except Exception as e:
+                rep.line(f"      ⚠️  {name} export failed: {e}")
+
+        rep.line(f"\n   ✅ Export tests completed. Files saved to: {output_dir}")
+
     except Exception as e:
-        print(f"   ❌ Export tests failed: {e}")
-    finally:
-        os.chdir(original_dir)
+        rep.line(f"   ❌ Export tests failed: {e}")
 
 
 def test_calculations(tdb, transistor):
@@ -311,12 +318,12 @@ def test_calculations(tdb, transistor):
     print_section("Test 8: Calculation Functions")
     
     if transistor is None:
-        print("⚠️  Skipping - No transistor loaded")
+        rep.line("⚠️  Skipping - No transistor loaded")
         return
     
     try:
         # Test linearization
-        print("   Testing calc_lin_channel()...")
+        rep.line("   Testing calc_lin_channel()...")
         try:
             v_ch, r_ch = transistor.calc_lin_channel(
                 t_j=125,
@@ -324,9 +331,9 @@ def test_calculations(tdb, transistor):
                 i_channel=50,
                 switch_or_diode='switch'
             )
-            print(f"      ✅ Switch linearization: V={v_ch}V, R={r_ch}Ohm")
+            rep.line(f"      ✅ Switch linearization: V={v_ch}V, R={r_ch}Ohm")
         except Exception as e:
-            print(f"      ⚠️  Switch linearization failed: {e}")
+            rep.line(f"      ⚠️  Switch linearization failed: {e}")
         
         try:
             v_ch, r_ch = transistor.calc_lin_channel(
@@ -335,25 +342,25 @@ def test_calculations(tdb, transistor):
                 i_channel=50,
                 switch_or_diode='diode'
             )
-            print(f"      ✅ Diode linearization: V={v_ch}V, R={r_ch}Ohm")
+            rep.line(f"      ✅ Diode linearization: V={v_ch}V, R={r_ch}Ohm")
         except Exception as e:
-            print(f"      ⚠️  Diode linearization failed: {e}")
+            rep.line(f"      ⚠️  Diode linearization failed: {e}")
         
         # Test capacitance energy calculations
-        print("\n   Testing calc_v_eoss()...")
+        rep.line("\n   Testing calc_v_eoss()...")
         try:
             if transistor.graph_v_ecoss is not None:
                 e_oss = transistor.calc_v_eoss()
-                print(f"      ✅ E_oss calculation completed")
+                rep.line(f"      ✅ E_oss calculation completed")
             else:
-                print("      ⚠️  No C_oss data available")
+                rep.line("      ⚠️  No C_oss data available")
         except Exception as e:
-            print(f"      ⚠️  E_oss calculation failed: {e}")
+            rep.line(f"      ⚠️  E_oss calculation failed: {e}")
         
-        print("\n   ✅ Calculation tests completed")
+        rep.line("\n   ✅ Calculation tests completed")
         
     except Exception as e:
-        print(f"   ❌ Calculation tests failed: {e}")
+        rep.line(f"   ❌ Calculation tests failed: {e}")
 
 
 def test_database_operations(tdb, transistor):
@@ -361,63 +368,66 @@ def test_database_operations(tdb, transistor):
     print_section("Test 9: Database Operations")
     
     if transistor is None:
-        print("⚠️  Skipping - No transistor loaded")
+        rep.line("⚠️  Skipping - No transistor loaded")
         return
     
     try:
         # Test print_tdb
-        print("   Testing print_tdb()...")
+        rep.line("   Testing print_tdb()...")
         tdb.print_tdb()
-        print("      ✅ Database summary printed")
+        rep.line("      ✅ Database summary printed")
         
         # Test convert to dict
-        print("\n   Testing convert_to_dict()...")
+        rep.line("\n   Testing convert_to_dict()...")
         transistor_dict = transistor.convert_to_dict()
-        print(f"      ✅ Transistor converted to dictionary")
-        print(f"      Dictionary keys: {len(transistor_dict)}")
+        rep.line(f"      ✅ Transistor converted to dictionary")
+        rep.line(f"      Dictionary keys: {len(transistor_dict)}")
         
-        print("\n   ✅ Database operation tests completed")
+        rep.line("\n   ✅ Database operation tests completed")
         
     except Exception as e:
-        print(f"   ❌ Database operation tests failed: {e}")
+        rep.line(f"   ❌ Database operation tests failed: {e}")
 
 
 def main():
     """Run all tests."""
-    print("\n" + "=" * 70)
-    print("  TRANSISTOR DATABASE - COMPREHENSIVE TEST SUITE")
-    print("=" * 70)
-    print(f"\nConfiguration:")
-    print(f"  Plotting enabled: {ENABLE_PLOTTING}")
-    print(f"  Exports enabled: {ENABLE_EXPORTS}")
+    rep.line("\n" + "=" * 70)
+    rep.line("  TRANSISTOR DATABASE - COMPREHENSIVE TEST SUITE")
+    rep.line("=" * 70)
+    rep.line(f"\nConfiguration:")
+    rep.line(f"  Plotting enabled: {ENABLE_PLOTTING}")
+    rep.line(f"  Exports enabled: {ENABLE_EXPORTS}")
+    rep.flush()
     
     try:
         # Run tests in sequence
         tdb, db_path = test_database_initialization()
+        rep.flush()
         transistor_name = test_list_transistors(tdb)
+        rep.flush()
         transistor = test_load_transistor(tdb, transistor_name)
+        rep.flush()
         
-        # Run feature tests
-        test_working_point(tdb, transistor)
-        test_data_access(tdb, transistor)
-        test_plotting(tdb, transistor)
-        test_calculations(tdb, transistor)
-        test_database_operations(tdb, transistor)
-        test_export_functions(tdb, transistor)
+        # Run feature tests, the output of each test is written once it has finished
+        for feature_test in [test_working_point, test_data_access, test_plotting, test_calculations,
+                             test_database_operations, test_export_functions]:
+            feature_test(tdb, transistor)
+            rep.flush()
         
         # Summary
         print_section("Test Summary")
-        print("✅ All tests completed successfully!")
-        print(f"\nNext steps:")
-        print(f"  1. Check the 'test_outputs' folder for exported files")
-        print(f"  2. Set ENABLE_PLOTTING=True to see visualization plots")
-        print(f"  3. Explore the examples/ folder for more usage examples")
-        print(f"  4. Check the documentation for advanced features")
+        rep.line("✅ All tests completed successfully!")
+        rep.line(f"\nNext steps:")
+        rep.line(f"  1. Check the 'test_outputs' folder for exported files")
+        rep.line(f"  2. Set ENABLE_PLOTTING=True to see visualization plots")
+        rep.line(f"  3. Explore the examples/ folder for more usage examples")
+        rep.line(f"  4. Check the documentation for advanced features")
+        rep.flush()
         
     except Exception as e:
         print_section("Test Summary")
-        print(f"❌ Tests failed with error: {e}")
-        import traceback
+        rep.line(f"❌ Tests failed with error: {e}")
+        rep.flush()
         traceback.print_exc()
         sys.exit(1)
 
@@ -450,6 +450,17 @@ def test_check_str():
         tdb.check_str([1, 2, 3])
 
 
+def test_get_closest_dataset_index():
+    """Unit test for get_closest_dataset_index."""
+    graph_v_i = np.array([[0, 1], [0, 10]])
+    channels = [tdb.ChannelData({'t_j': t_j, 'v_g': v_g, 'graph_v_i': graph_v_i}) for t_j, v_g in [(25, 15), (125, 15), (125, 11), (175, None)]]
+    assert tdb.get_closest_dataset_index(channels, t_j=125, v_g=15) == 1
+    assert tdb.get_closest_dataset_index(channels, t_j=120, v_g=10) == 2
+    assert tdb.get_closest_dataset_index(channels, t_j=175, v_g=1) == 3
+    # 10 °C are weighted the same as 1 V
+    assert tdb.get_closest_dataset_index(channels, t_j=70, v_g=15, normalize_t_to_v=10) == 0
+
+
 @patch.object(tdb, "connect_local_tdb")
 def test_connect_local_tdb(connect_local_tdb):
     """
@@ -11,6 +11,13 @@ import deepdiff
 import glob  # Can this be removed?
 import logging
 
+# Third party libraries
+try:
+    # Optional: orjson parses the large numeric arrays of the transistor files considerably faster
+    import orjson
+except ImportError:
+    orjson = None
+
 # Local libraries
 from transistordatabase.transistor import Transistor
 from transistordatabase.mongodb_handling import connect_local_tdb 
@@ -19,6 +26,25 @@ from transistordatabase.checker_functions import check_float
 
 logger = logging.getLogger(__name__)
 
+def _read_json_file(file_path: str) -> dict:
+    """
+    Read a json file. orjson is used if it is installed, otherwise the standard json module.
+
+    :param file_path: path to the json file
+    :type file_path: str
+    :return: content of the json file
+    :rtype: dict
+    """
+    with open(file_path, "rb") as fd:
+        content = fd.read()
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # orjson does not accept NaN/Infinity, which the standard json module writes for such floats
+            pass
+    return json.loads(content)
+
 class OperationMode(Enum):
     """Operation mode definitions."""
 
@@ -202,11 +228,18 @@ class DatabaseManager:
             raise Exception("Please select an operation mode for the database manager.")
 
         if self.operation_mode == OperationMode.JSON:
-            existing_files = os.listdir(self.json_folder)
-            for file_name in existing_files:
-                if file_name.endswith(".json") and file_name.startswith(str(transistor_name)) and isvalid_transistor_name(file_name[:-5]):
-                    with open(os.path.join(self.json_folder, file_name), "r") as fd:
-                        return self.convert_dict_to_transistor_object(json.load(fd))
+            # The file name equals the transistor name, so in most cases the file can be opened without listing the folder
+            transistor_path = os.path.join(self.json_folder, f"{transistor_name}.json")
+            if not (os.path.isfile(transistor_path) and isvalid_transistor_name(str(transistor_name))):
+                transistor_path = None
+                with os.scandir(self.json_folder) as entries:
+                    for entry in entries:
+                        if entry.name.endswith(".json") and entry.name.startswith(str(transistor_name)) and isvalid_transistor_name(entry.name[:-5]) \
+                                and entry.is_file():
+                            transistor_path = entry.path
+                            break
+            if transistor_path is not None:
+                return self.convert_dict_to_transistor_object(_read_json_file(transistor_path))
             logger.info(f"Transitor with name {transistor_name} not found.")
         elif self.operation_mode == OperationMode.MONGODB:
             return self.convert_dict_to_transistor_object(self.mongodb_collection.find_one({"name": transistor_name}))
@@ -224,11 +257,10 @@ class DatabaseManager:
             raise Exception("Please select an operation mode for the database manager.")
 
         if self.operation_mode == OperationMode.JSON:
-            transistor_list = []
-            existing_files = os.listdir(self.json_folder)
-            for file in existing_files:
-                if isvalid_transistor_name(file[:-5]):
-                    transistor_list.append(file[:-5])
+            # The transistor name equals the file name, so the json files do not need to be parsed
+            with os.scandir(self.json_folder) as entries:
+                transistor_list = [entry.name.removesuffix(".json") for entry in entries
+                                   if entry.name.endswith(".json") and entry.is_file() and isvalid_transistor_name(entry.name.removesuffix(".json"))]
 
             return transistor_list
         elif self.operation_mode == OperationMode.MONGODB:
@@ -1,12 +1,11 @@
 """Diode class."""
 # Python standard libraries
 from matplotlib import pyplot as plt
-from scipy.spatial import distance
 import numpy as np
 import logging
 
 # Local libraries
-from transistordatabase.helper_functions import get_img_raw_data, isvalid_dict
+from transistordatabase.helper_functions import get_img_raw_data, isvalid_dict, get_closest_dataset_index
 from transistordatabase.checker_functions import check_keys
 from transistordatabase.data_classes import FosterThermalModel, ChannelData, SwitchEnergyData, LinearizedModel, SOA
 from transistordatabase.exceptions import MissingDataError
@@ -225,13 +224,8 @@ class Diode:
         :return: channel-object, e_rr-object
         :rtype: tuple[Transistor.ChannelData, Transistor.SwitchEnergyData]
         """
-        # Normalize t_j to v_g for distance metric
-        node = np.array([[t_j / normalize_t_to_v, v_g]])
         # Find closest channeldata
-        channeldata_t_js = np.array([chan.t_j for chan in self.channel])
-        channeldata_v_gs = np.array([0 if chan.v_g is None else chan.v_g for chan in self.channel])
-        nodes = np.array([channeldata_t_js / normalize_t_to_v, channeldata_v_gs]).transpose()
-        index_channeldata = distance.cdist(node, nodes).argmin()
+        index_channeldata = get_closest_dataset_index(self.channel, t_j, v_g, normalize_t_to_v)
         # Find closest e_rr
         e_rrs = [e for e in self.e_rr if e.dataset_type == switch_energy_dataset_type]
         if not e_rrs:
@@ -239,10 +233,7 @@ class Diode:
             e_rrs = [None]
             index_e_rr = 0
         else:
-            e_rr_t_js = np.array([e.t_j for e in e_rrs])
-            e_rr_v_gs = np.array([0 if e.v_g is None else e.v_g for e in e_rrs])
-            nodes = np.array([e_rr_t_js / normalize_t_to_v, e_rr_v_gs]).transpose()
-            index_e_rr = distance.cdist(node, nodes).argmin()
+            index_e_rr = get_closest_dataset_index(e_rrs, t_j, v_g, normalize_t_to_v)
 
             logger.info("run diode.find_approx_wp: closest working point for t_j = {0} °C and v_g = {1} V:".format(t_j, v_g))
             logger.info("channel: t_j = {0} °C and v_g = {1} V".format(self.channel[index_channeldata].t_j, self.channel[index_channeldata].v_g))
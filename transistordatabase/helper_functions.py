@@ -770,6 +770,29 @@ def compare_list(parameter: list):
             return False
     return True
 
+def get_closest_dataset_index(datasets: list, t_j: float, v_g: float, normalize_t_to_v: float = 10) -> int:
+    """
+    Return the index of the dataset closest to the given junction temperature and gate voltage.
+
+    The distance is measured in the (t_j / normalize_t_to_v, v_g)-plane. Datasets without a gate voltage are treated as v_g = 0.
+
+    :param datasets: list of ChannelData or SwitchEnergyData objects
+    :type datasets: list
+    :param t_j: junction temperature
+    :type t_j: float
+    :param v_g: gate voltage
+    :type v_g: float
+    :param normalize_t_to_v: ratio between t_j and v_g. e.g. 10 means 10°C is same difference as 1V
+    :type normalize_t_to_v: float
+    :return: index of the closest dataset
+    :rtype: int
+    """
+    t_js = np.fromiter((dataset.t_j for dataset in datasets), dtype=np.float64, count=len(datasets))
+    v_gs = np.fromiter((0 if dataset.v_g is None else dataset.v_g for dataset in datasets), dtype=np.float64, count=len(datasets))
+    # argmin of the squared euclidean distance equals argmin of the distance, so no square root is needed
+    squared_distances = (t_js / normalize_t_to_v - t_j / normalize_t_to_v) ** 2 + (v_gs - v_g) ** 2
+    return int(squared_distances.argmin())
+
 def get_copy_transistor_name(current_name: str) -> str:
     """
     Return the current name but with an index at the end similar to windows copies.
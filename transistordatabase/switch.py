@@ -1,12 +1,11 @@
 """Switch class."""
 # Python standard libraries
 from matplotlib import pyplot as plt
-from scipy.spatial import distance
 import numpy as np
 import logging
 
 # Local libraries
-from transistordatabase.helper_functions import get_img_raw_data, isvalid_dict
+from transistordatabase.helper_functions import get_img_raw_data, isvalid_dict, get_closest_dataset_index
 from transistordatabase.checker_functions import check_keys
 from transistordatabase.data_classes import FosterThermalModel, ChannelData, SwitchEnergyData, LinearizedModel, TemperatureDependResistance, \
     GateChargeCurve, SOA
@@ -366,30 +365,19 @@ class Switch:
         :return: channel-object, e_on-object, e_off-object
         :rtype: tuple[Transistor.ChannelData, Transistor.SwitchEnergyData, Transistor.SwitchEnergyData]
         """
-        # Normalize t_j to v_g for distance metric
-        node = np.array([[t_j / normalize_t_to_v, v_g]])
         # Find closest channeldata
-        channeldata_t_js = np.array([chan.t_j for chan in self.channel])
-        channeldata_v_gs = np.array([0 if chan.v_g is None else chan.v_g for chan in self.channel])
-        nodes = np.array([channeldata_t_js / normalize_t_to_v, channeldata_v_gs]).transpose()
-        index_channeldata = distance.cdist(node, nodes).argmin()
+        index_channeldata = get_closest_dataset_index(self.channel, t_j, v_g, normalize_t_to_v)
 
         # Find closest e_on
         e_ons = [e for e in self.e_on if e.dataset_type == switch_energy_dataset_type]
         if not e_ons:
             raise KeyError(f"There is no e_on data with type {switch_energy_dataset_type} for this Switch object.")
-        e_on_t_js = np.array([e.t_j for e in e_ons])
-        e_on_v_gs = np.array([0 if e.v_g is None else e.v_g for e in e_ons])
-        nodes = np.array([e_on_t_js / normalize_t_to_v, e_on_v_gs]).transpose()
-        index_e_on = distance.cdist(node, nodes).argmin()
+        index_e_on = get_closest_dataset_index(e_ons, t_j, v_g, normalize_t_to_v)
         # Find closest e_off
         e_offs = [e for e in self.e_off if e.dataset_type == switch_energy_dataset_type]
         if not e_offs:
             raise KeyError(f"There is no e_off data with type {switch_energy_dataset_type} for this Switch object.")
-        e_off_t_js = np.array([e.t_j for e in e_offs])
-        e_off_v_gs = np.array([0 if e.v_g is None else e.v_g for e in e_offs])
-        nodes = np.array([e_off_t_js / normalize_t_to_v, e_off_v_gs]).transpose()
-        index_e_off = distance.cdist(node, nodes).argmin()
+        index_e_off = get_closest_dataset_index(e_offs, t_j, v_g, normalize_t_to_v)
         logger.info("run switch.find_approx_wp: closest working point for t_j = {0} °C and v_g = {1} V:".format(t_j, v_g))
         logger.info(f"channel: t_j = {self.channel[index_channeldata].t_j} °C and v_g = {self.channel[index_channeldata].v_g} V")
         logger.info(f"eon:     t_j = {e_ons[index_e_on].t_j} °C and v_g = {e_ons[index_e_on].v_g} V")
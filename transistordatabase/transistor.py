@@ -473,10 +473,10 @@ class Transistor:
         :return: e_oss numpy array
         :rtype: np.array
         """
-        # energy_cumtrapz = np.zeros_like(self.c_oss[0].graph_v_c[1], dtype=np.float32)
-        energy_cumtrapz = integrate.cumulative_trapezoid(self.c_oss[0].graph_v_c[0] * self.c_oss[0].graph_v_c[1],
-                                                         self.c_oss[0].graph_v_c[0], initial=0)
-        return np.array([self.c_oss[0].graph_v_c[0], energy_cumtrapz])
+        voltage, capacitance = np.asarray(self.c_oss[0].graph_v_c, dtype=np.float64)
+        # e_oss(v) = integral of v * c_oss(v) dv, the trapezoidal rule is evaluated vectorized in one pass
+        energy_cumtrapz = integrate.cumulative_trapezoid(voltage * capacitance, voltage, initial=0)
+        return np.array([voltage, energy_cumtrapz])
 
     def calc_v_qoss(self) -> np.array:
         """
@@ -1476,7 +1476,7 @@ class Transistor:
             return html  
         
     def export_simulink_loss_model(self, r_g_on: float = None, r_g_off: float = None, v_supply: float = None,
-                                   normalize_t_to_v: float = 10) -> None:
+                                   normalize_t_to_v: float = 10, filepath: str = None) -> None:
         """
         Export a simulation model for simulink inverter loss models.
 
@@ -1492,6 +1492,8 @@ class Transistor:
         :type v_supply: float
         :param normalize_t_to_v: a normalize value used in computing cartesian distance
         :type normalize_t_to_v: float
+        :param filepath: directory to save the .mat file. CWD is used in case of None.
+        :type filepath: str
 
         :raises Exception: Re-raised excception by calling calc_object_i_e(..)
         :raises ValueError: Raised when the switch type is other than IGBT
@@ -1656,15 +1658,20 @@ class Transistor:
                                'r_g_off': np.double(eoff_object_lower.r_g),
                                }
 
-            sio.savemat(self.name.replace('-', '_') + '_Simulink_lossmodel.mat', {self.name.replace('-', '_'): transistor_dict})
-            logger.info(f"Export files {self.name}_Simulink_lossmodel.mat to {os.getcwd()}")
+            if filepath is None:
+                filepath = os.getcwd()
+            sio.savemat(os.path.join(filepath, self.name.replace('-', '_') + '_Simulink_lossmodel.mat'), {self.name.replace('-', '_'): transistor_dict})
+            logger.info(f"Export files {self.name}_Simulink_lossmodel.mat to {filepath}")
         except Exception as e:
             logger.info("Simulink exporter failed: {0}".format(e))
 
-    def export_matlab(self) -> None:
+    def export_matlab(self, filepath: str = None) -> None:
         """
         Export a transistor dictionary to a matlab dictionary.
 
+        :param filepath: directory to save the .mat file. CWD is used in case of None.
+        :type filepath: str
+
         :Example:
 
         >>> import transistordatabase as tdb
@@ -1680,8 +1687,10 @@ class Transistor:
         transistor_clean_dict['file_generated'] = f"{datetime.today()}"
         transistor_clean_dict['file_generated_by'] = "https://github.com/upb-lea/transistordatabase",
 
-        sio.savemat(self.name.replace('-', '_') + '_Matlab.mat', {self.name.replace('-', '_'): transistor_clean_dict})
-        logger.info(f"Export files {self.name.replace('-', '_')}_Matlab.mat to {os.getcwd()}")
+        if filepath is None:
+            filepath = os.getcwd()
+        sio.savemat(os.path.join(filepath, self.name.replace('-', '_') + '_Matlab.mat'), {self.name.replace('-', '_'): transistor_clean_dict})
+        logger.info(f"Export files {self.name.replace('-', '_')}_Matlab.mat to {filepath}")
 
     def collect_i_e_and_r_e_combination(self, switch_type: str, loss_type: str) -> tuple[list, list]:
         """
@@ -2076,7 +2085,7 @@ class Transistor:
         file_c_oss.close()
         logger.info(f"Exported file {nlc_filename} to {os.getcwd()}")
 
-    def export_plecs(self, recheck: bool = True, gate_voltages: list | None = None) -> None:
+    def export_plecs(self, recheck: bool = True, gate_voltages: list | None = None, filepath: str = None) -> None:
         """
         Generate and export the switch and diode .xmls files to be imported into plecs simulator.
 
@@ -2086,6 +2095,8 @@ class Transistor:
         :type recheck: bool
         :param gate_voltages: gate voltage like v_g_on, v_g_off, v_d_on, v_d_off
         :type gate_voltages: list
+        :param filepath: directory to save the .xml files. CWD is used in case of None.
+        :type filepath: str
 
         :Example:
 
@@ -2095,6 +2106,8 @@ class Transistor:
         """
         if gate_voltages is None:
             gate_voltages = []
+        if filepath is None:
+            filepath = os.getcwd()
         switch_xml_data, diode_xml_data = self.get_curve_data(recheck, gate_voltages)
         template_dir = os.path.join(os.path.dirname(__file__), "templates")
         env = Environment(loader=FileSystemLoader(template_dir), autoescape=True)
@@ -2108,7 +2121,7 @@ class Transistor:
                 data['TurnOffLoss']['Energy'] = collections.OrderedDict(sorted(data['TurnOffLoss']['Energy'].items()))
                 template = env.get_template('PLECS_Exporter_template_Diode.txt')
                 output = template.render(diode=data)
-                with open(data['partnumber'] + "_diode.xml", "w") as fh:
+                with open(os.path.join(filepath, data['partnumber'] + "_diode.xml"), "w") as fh:
                     fh.write(output)
             elif data['type'] == 'IGBT' or data['type'] == 'MOSFET' or data['type'] == 'SiC-MOSFET':
                 if data['type'] == 'MOSFET' or data['type'] == 'SiC-MOSFET':
@@ -2121,9 +2134,9 @@ class Transistor:
                 template = env.get_template('PLECS_Exporter_template_Switch.txt')
                 output = template.render(transistor=data)
                 str_decoded = output.encode()
-                with open(data['partnumber'] + "_switch.xml", "w") as fh:
+                with open(os.path.join(filepath, data['partnumber'] + "_switch.xml"), "w") as fh:
                     fh.write(str_decoded.decode())
-        logger.info("Export files {0}_switch.xml and {1}_diode.xml to {2}".format(data['partnumber'], data['partnumber'], os.getcwd()))
+        logger.info("Export files {0}_switch.xml and {1}_diode.xml to {2}".format(data['partnumber'], data['partnumber'], filepath))
 
     class WP:
         """